@@ -5,10 +5,27 @@ Script de scraping des commentaires d'articles du Monde
 Auteur: Assistant Claude
 """
 
+import asyncio
+import codecs
+import copy
+import concurrent.futures
+import contextlib
+import httpx
+from aiolimiter import AsyncLimiter
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+from lxml import etree, html
+import hashlib
 import json
+import logging
+import orjson
+import os
+import threading
 import time
+import weakref
+from urllib.parse import urlparse
 import csv
 from datetime import datetime
 from selenium import webdriver
@@ -16,20 +33,191 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import re
+from selenium.common.exceptions import (
+    InvalidSessionIdException, TimeoutException, WebDriverException
+)
+from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Requêtes XPath compilées une seule fois (exécutées en C par lxml)
+_COMMENT_OR_JSON_XPATH = etree.XPath(
+    "//div[contains(translate(@class, 'COMENT', 'coment'), 'comment')]"
+    " | //script[@type='application/json']"
+)
+_AUTHOR_XPATH = etree.XPath(
+    "(.//*[contains(@class, 'author')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' username ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' user-name ')])[1]"
+)
+_DATE_XPATH = etree.XPath(
+    "(.//*[self::time or @datetime"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' date ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' timestamp ')])[1]"
+)
+# Texte visible d'un élément : le contenu des <script> et <style> est exclu
+_TEXT_XPATH = etree.XPath(".//text()[not(ancestor::script or ancestor::style)]")
+
+# Taille maximale acceptée pour une page HTML (en octets)
+_MAX_PAGE_SIZE = 5_000_000
+
+def _now_iso():
+    """Horodatage ISO à la seconde, partagé par tous les articles d'un lot"""
+    return datetime.now().isoformat(timespec='seconds')
+
+def _text(element):
+    """Texte d'un élément, chaque morceau nettoyé de ses espaces"""
+    return ''.join(t.strip() for t in _TEXT_XPATH(element))
+
+def _long_enough(element, threshold=20):
+    """
+    Indique si le texte de l'élément dépasse `threshold` caractères, sans
+    construire la chaîne complète : on s'arrête dès que le seuil est franchi
+    """
+    total = 0
+    for t in _TEXT_XPATH(element):
+        total += len(t.strip())
+        if total > threshold:
+            return True
+    return False
+
+def _charset(content_type):
+    """Encodage annoncé dans un en-tête Content-Type, ou None s'il est absent ou inconnu"""
+    for param in content_type.split(';')[1:]:
+        key, _, value = param.partition('=')
+        if key.strip().lower() == 'charset':
+            try:
+                return codecs.lookup(value.strip().strip('"\'')).name
+            except LookupError:
+                return None
+    return None
+
+def _parse_article(content, url, scraped_at=None, encoding=None):
+    """
+    Analyse le HTML d'un article et en extrait le titre et les commentaires
+    
+    Fonction de module (et non méthode) pour pouvoir être exécutée dans un
+    processus séparé.
+    
+    Args:
+        content (bytes): Contenu HTML de la page
+        url (str): URL de l'article
+        scraped_at (str): Horodatage du lot en cours (par défaut : maintenant)
+        encoding (str): Encodage annoncé par le serveur (par défaut : détecté
+            depuis la page, <meta charset> ou Latin-1)
+        
+    Returns:
+        dict: Données extraites
+    """
+    parser = html.HTMLParser(encoding=encoding) if encoding else None
+    tree = html.fromstring(content, parser=parser)
+    
+    # Extraction du titre de l'article
+    h1 = tree.find('.//h1')
+    title_elem = h1 if h1 is not None else tree.find('.//title')
+    title = _text(title_elem) if title_elem is not None else "Titre non trouvé"
+    
+    # Recherche des commentaires dans différentes structures possibles, en
+    # un seul parcours de l'arbre :
+    # - divs avec classes contenant "comment"
+    # - scripts JSON-LD ou autres
+    comments = []
+    for node in _COMMENT_OR_JSON_XPATH(tree):
+        if node.tag == 'script':
+            try:
+                data = orjson.loads(node.text)
+                if isinstance(data, dict) and 'comments' in data:
+                    for comment in data['comments']:
+                        comments.append({
+                            'text': comment.get('text', ''),
+                            'author': comment.get('author', 'Anonyme'),
+                            'date': comment.get('date', '')
+                        })
+            except (orjson.JSONDecodeError, TypeError, AttributeError):
+                continue
+        elif _long_enough(node):  # Filtre les commentaires trop courts
+            comments.append({
+                'text': _text(node),
+                'author': _extract_author(node),
+                'date': _extract_date(node)
+            })
+    
+    return {
+        'url': url,
+        'title': title,
+        'comments': comments,
+        'scraped_at': scraped_at or _now_iso()
+    }
+
+def _extract_author(element):
+    """Extrait le nom de l'auteur d'un commentaire (lxml)"""
+    res = _AUTHOR_XPATH(element)
+    return _text(res[0]) if res else "Anonyme"
+
+def _extract_date(element):
+    """Extrait la date d'un commentaire (lxml)"""
+    res = _DATE_XPATH(element)
+    return (res[0].get('datetime') or _text(res[0])) if res else ""
 
 class LeMondeScraper:
-    def __init__(self, headless=True, delay=2):
+    # Fonction JS appliquée à chaque élément dans le navigateur (Selenium/Playwright).
+    # innerText n'existe pas sur les éléments SVG : repli sur textContent.
+    _COMMENT_FIELDS_JS = """e => {
+        const author = e.querySelector("[class*='author'], .username, .user-name");
+        const date = e.querySelector("time, .date, .timestamp, [datetime]");
+        return {
+            text: (e.innerText ?? e.textContent ?? '').trim(),
+            author: author ? (author.innerText ?? author.textContent ?? '').trim() : 'Anonyme',
+            date: date ? (date.getAttribute('datetime') || (date.innerText ?? date.textContent ?? '').trim()) : ''
+        };
+    }"""
+    # En-têtes forçant une réponse complète (sans 304) du serveur et des caches
+    _UNCONDITIONAL = {'Cache-Control': 'no-cache', 'Pragma': 'no-cache'}
+    
+    def __init__(self, headless=True, delay=2, concurrency=8,
+                 validators_file=None):
         """
         Initialise le scraper
         
         Args:
             headless (bool): Mode sans interface graphique
             delay (int): Délai entre les requêtes en secondes
+            concurrency (int): Nombre maximum de requêtes simultanées (mode asynchrone)
+            validators_file (str): Fichier de cache des ETag/Last-Modified par URL (None : cache en mémoire uniquement)
         """
+        self.headless = headless
         self.delay = delay
+        self.concurrency = concurrency
         self.session = requests.Session()
         
+        # Pool de connexions élargi et relances automatiques sur les erreurs
+        # transitoires : les sockets TLS vers lemonde.fr sont réutilisés
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount('https://', adapter)
+        
+        # Espacement des requêtes par hôte pour le mode synchrone (threads) :
+        # verrou et prochain instant autorisé (horloge monotone) par hôte
+        self._host_locks = {}
+        self._host_next = {}
+        self._host_locks_guard = threading.Lock()
+        
+        # Limiteurs de débit (seau à jetons) par boucle d'événements puis par
+        # hôte, partagés par les tâches asynchrones d'une même boucle
+        self._limiters = weakref.WeakKeyDictionary()
+        
+        # Processus dédiés à l'analyse HTML pour ne pas bloquer la boucle
+        # asynchrone, créés au premier besoin
+        self._parse_pool = None
+        
+        # Cache HTTP : {url: {'etag', 'last_modified', 'sha256', 'payload'}}
+        self.validators_file = validators_file
+        self.validators = self._load_validators()
+        
         # Headers pour simuler un navigateur réel
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -49,68 +237,278 @@ class LeMondeScraper:
             self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
             self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             self.chrome_options.add_experimental_option('useAutomationExtension', False)
+        
+        # Navigateur partagé entre les URLs, créé au premier besoin
+        self._driver = None
     
-    def scrape_with_requests(self, url):
+    def scrape_with_requests(self, url, scraped_at=None):
         """
         Méthode de scraping avec requests (plus rapide mais limitée)
         
         Args:
             url (str): URL de l'article
+            scraped_at (str): Horodatage du lot en cours (par défaut : maintenant)
             
         Returns:
             dict: Données extraites
         """
         try:
-            print(f"Récupération de la page : {url}")
-            response = self.session.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extraction du titre de l'article
-            title_elem = soup.find('h1') or soup.find('title')
-            title = title_elem.get_text(strip=True) if title_elem else "Titre non trouvé"
+            logger.info("Récupération de la page : %s", url)
+            headers = {**self.headers, **self._conditional_headers(url)}
+            # Le corps n'est lu qu'après vérification des en-têtes
+            self._throttle(url)
+            response = self.session.get(url, headers=headers, stream=True, timeout=(3.05, 10))
+            if response.status_code == 304 and url not in self.validators:
+                # 304 sans données en cache : on redemande la page complète
+                response.close()
+                self._throttle(url)
+                response = self.session.get(url, headers={**self.headers, **self._UNCONDITIONAL},
+                                            stream=True, timeout=(3.05, 10))
+            with response:
+                content = b''
+                if response.status_code != 304:
+                    response.raise_for_status()
+                    content_type = response.headers.get('Content-Type', '')
+                    content_length = int(response.headers.get('Content-Length') or 0)
+                    if not content_type.startswith('text/html') or content_length > _MAX_PAGE_SIZE:
+                        logger.warning("Réponse ignorée (%s, %s octets) : %s", content_type, content_length, url)
+                        return None
+                    
+                    content = response.raw.read(_MAX_PAGE_SIZE + 1, decode_content=True)
+                    if len(content) > _MAX_PAGE_SIZE:
+                        logger.warning("Page trop volumineuse, ignorée : %s", url)
+                        return None
             
-            # Recherche des commentaires dans différentes structures possibles
-            comments = []
-            
-            # Structure 1: divs avec classes contenant "comment"
-            comment_divs = soup.find_all('div', class_=re.compile(r'comment', re.I))
-            for div in comment_divs:
-                comment_text = div.get_text(strip=True)
-                if len(comment_text) > 20:  # Filtre les commentaires trop courts
-                    comments.append({
-                        'text': comment_text,
-                        'author': self._extract_author(div),
-                        'date': self._extract_date(div)
-                    })
+            return self._handle_response(url, response.status_code,
+                                         response.headers, content, scraped_at,
+                                         _charset(response.headers.get('Content-Type', '')))
+        
+        except Exception as e:
+            logger.warning("Erreur lors du scraping avec requests : %s", e)
+            return None
+    
+    def _throttle(self, url):
+        """Attend son tour pour l'hôte de l'URL : une requête toutes les `delay` secondes"""
+        if not self.delay:
+            return
+        host = urlparse(url).netloc
+        with self._host_locks_guard:
+            lock = self._host_locks.setdefault(host, threading.Lock())
+        with lock:
+            wait = self._host_next.get(host, 0) - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._host_next[host] = time.monotonic() + self.delay
+    
+    def scrape_urls(self, urls, max_workers=10):
+        """
+        Scrape une liste d'articles en parallèle avec des threads (requests).
+        Les requêtes vers un même hôte restent espacées de `delay` secondes.
+        
+        Args:
+            urls (list): URLs des articles
+            max_workers (int): Nombre de threads (rester sous la taille du pool de connexions)
             
-            # Structure 2: Recherche dans les scripts JSON-LD ou autres
-            scripts = soup.find_all('script', type='application/json')
-            for script in scripts:
-                try:
-                    data = json.loads(script.string)
-                    if isinstance(data, dict) and 'comments' in data:
-                        for comment in data['comments']:
-                            comments.append({
-                                'text': comment.get('text', ''),
-                                'author': comment.get('author', 'Anonyme'),
-                                'date': comment.get('date', '')
-                            })
-                except json.JSONDecodeError:
-                    continue
+        Returns:
+            list: Données extraites pour chaque URL (None en cas d'échec)
+        """
+        scraped_at = _now_iso()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda url: self.scrape_with_requests(url, scraped_at), urls
+            ))
+    
+    def _async_client(self):
+        """
+        Crée un client asynchrone HTTP/2 : les requêtes simultanées sont
+        multiplexées sur une seule connexion TLS vers lemonde.fr. Le client est
+        lié à la boucle d'événements qui l'utilise, on en crée donc un par lot.
+        """
+        # L'en-tête Connection est interdit en HTTP/2 et httpx gère lui-même Accept-Encoding
+        return httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            headers={k: v for k, v in self.headers.items()
+                     if k not in ('Connection', 'Accept-Encoding')},
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(10.0),
+        )
+    
+    async def scrape_with_httpx(self, url, client=None, semaphore=None, scraped_at=None):
+        """
+        Méthode de scraping asynchrone avec httpx (HTTP/2)
+        
+        Args:
+            url (str): URL de l'article
+            client (httpx.AsyncClient): Client du lot en cours (par défaut : un client dédié)
+            semaphore (asyncio.Semaphore): Limite le nombre de requêtes simultanées
+            scraped_at (str): Horodatage du lot en cours (par défaut : maintenant)
             
-            return {
-                'url': url,
-                'title': title,
-                'comments': comments,
-                'scraped_at': datetime.now().isoformat()
-            }
+        Returns:
+            dict: Données extraites
+        """
+        if client is None:
+            async with self._async_client() as client:
+                return await self.scrape_with_httpx(url, client, semaphore, scraped_at)
+        
+        semaphore = semaphore or asyncio.Semaphore(self.concurrency)
+        try:
+            async with self._limiter_for(url), semaphore:
+                logger.info("Récupération de la page : %s", url)
+                response = await client.get(url, headers=self._conditional_headers(url))
+                if response.status_code == 304 and url not in self.validators:
+                    # 304 sans données en cache : on redemande la page complète
+                    response = await client.get(url, headers=self._UNCONDITIONAL)
+                if response.status_code != 304:
+                    response.raise_for_status()
             
+            data, digest = self._check_cache(url, response.status_code, response.content, scraped_at)
+            if digest is None:
+                return data
+            if data is None:
+                loop = asyncio.get_running_loop()
+                data = await loop.run_in_executor(
+                    self._get_parse_pool(), _parse_article, response.content, url, scraped_at,
+                    response.charset_encoding
+                )
+            self._remember(url, response.headers, digest, data)
+            return data
+        
         except Exception as e:
-            print(f"Erreur lors du scraping avec requests : {e}")
+            logger.warning("Erreur lors du scraping avec httpx : %s", e)
             return None
     
+    async def scrape_many(self, urls):
+        """
+        Scrape une liste d'articles en parallèle sur un même client HTTP/2
+        
+        Args:
+            urls (list): URLs des articles
+            
+        Returns:
+            list: Données extraites pour chaque URL (None en cas d'échec)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        scraped_at = _now_iso()
+        async with self._async_client() as client:
+            return await asyncio.gather(
+                *[self.scrape_with_httpx(url, client, semaphore, scraped_at) for url in urls]
+            )
+    
+    def _limiter_for(self, url):
+        """Renvoie le limiteur de l'hôte de l'URL : une requête toutes les `delay` secondes"""
+        if not self.delay:
+            return contextlib.nullcontext()
+        limiters = self._limiters.setdefault(asyncio.get_running_loop(), {})
+        host = urlparse(url).netloc
+        if host not in limiters:
+            limiters[host] = AsyncLimiter(1, self.delay)
+        return limiters[host]
+    
+    def _get_parse_pool(self):
+        """Renvoie le pool de processus d'analyse, en le créant si besoin"""
+        if self._parse_pool is None:
+            self._parse_pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._parse_pool
+    
+    async def aclose(self):
+        """Variante asynchrone de close(), utilisable depuis une boucle d'événements"""
+        self.close()
+    
+    def _load_validators(self):
+        """Charge le cache des validateurs HTTP depuis le disque"""
+        if not self.validators_file or not os.path.exists(self.validators_file):
+            return {}
+        try:
+            with open(self.validators_file, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+    
+    def save_validators(self):
+        """Sauvegarde le cache des validateurs HTTP sur le disque"""
+        if not self.validators_file:
+            return
+        with open(self.validators_file, 'w', encoding='utf-8') as f:
+            json.dump(self.validators, f, ensure_ascii=False)
+    
+    def _conditional_headers(self, url):
+        """Construit les en-têtes If-None-Match / If-Modified-Since pour une URL connue"""
+        entry = self.validators.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def _handle_response(self, url, status_code, headers, content, scraped_at=None, encoding=None):
+        """
+        Renvoie les données en cache si la page n'a pas changé, sinon l'analyse
+        
+        Args:
+            url (str): URL de l'article
+            status_code (int): Code HTTP de la réponse
+            headers (Mapping): En-têtes de la réponse
+            content (bytes): Contenu HTML de la page
+            scraped_at (str): Horodatage du lot en cours (par défaut : maintenant)
+            encoding (str): Encodage annoncé par le serveur
+            
+        Returns:
+            dict: Données extraites
+        """
+        data, digest = self._check_cache(url, status_code, content, scraped_at)
+        if digest is None:
+            return data
+        if data is None:
+            data = _parse_article(content, url, scraped_at, encoding)
+        self._remember(url, headers, digest, data)
+        return data
+    
+    def _check_cache(self, url, status_code, content, scraped_at=None):
+        """
+        Cherche dans le cache les données d'une page inchangée. Les données
+        renvoyées sont une copie : les modifier ne touche pas au cache. Leur
+        horodatage est remplacé par `scraped_at` (par défaut : maintenant), pour
+        qu'un lot ne mélange pas les dates de différentes exécutions.
+        
+        Returns:
+            tuple: (données en cache ou None, empreinte SHA-256 du contenu).
+                L'empreinte vaut None pour une réponse 304, qui ne doit pas
+                mettre à jour le cache.
+        """
+        entry = self.validators.get(url)
+        if status_code == 304:
+            if not entry:
+                raise ValueError(f"Réponse 304 sans données en cache pour {url}")
+            logger.info("Page inchangée (304), utilisation du cache : %s", url)
+            return self._restamp(entry['payload'], scraped_at), None
+        
+        # Certains serveurs renvoient des ETag faibles (W/...) qui changent à
+        # chaque requête : on compare alors l'empreinte du contenu
+        digest = hashlib.sha256(content).hexdigest()
+        if entry and entry.get('sha256') == digest:
+            logger.info("Contenu identique, utilisation du cache : %s", url)
+            return self._restamp(entry['payload'], scraped_at), digest
+        return None, digest
+    
+    def _restamp(self, payload, scraped_at=None):
+        """Copie des données en cache, avec l'horodatage du lot en cours"""
+        data = copy.deepcopy(payload)
+        data['scraped_at'] = scraped_at or _now_iso()
+        return data
+    
+    def _remember(self, url, headers, digest, data):
+        """Enregistre les validateurs HTTP et les données d'une page"""
+        self.validators[url] = {
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'sha256': digest,
+            'payload': copy.deepcopy(data),
+        }
+    
     def scrape_with_selenium(self, url, max_scroll=5):
         """
         Méthode de scraping avec Selenium (plus lente mais plus complète)
@@ -124,10 +522,8 @@ class LeMondeScraper:
         """
         driver = None
         try:
-            print(f"Ouverture de la page avec Selenium : {url}")
-            driver = webdriver.Chrome(options=self.chrome_options)
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
+            logger.info("Ouverture de la page avec Selenium : %s", url)
+            driver = self._ensure_driver()
             driver.get(url)
             
             # Attendre que la page se charge
@@ -141,170 +537,270 @@ class LeMondeScraper:
             except:
                 title = driver.title
             
-            # Faire défiler pour charger plus de commentaires
+            # Faire défiler pour charger plus de commentaires : on attend
+            # l'apparition de nouveaux commentaires plutôt qu'un délai fixe
+            misses = 0
             for i in range(max_scroll):
+                count = self._count_comments_selenium(driver)
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+                loaded = self._wait_for_more_comments(driver, count)
                 
                 # Chercher et cliquer sur "Voir plus de commentaires" si disponible
                 try:
                     load_more = driver.find_element(By.XPATH, "//*[contains(text(), 'commentaires') or contains(text(), 'Voir plus')]")
+                    count = self._count_comments_selenium(driver)
                     driver.execute_script("arguments[0].click();", load_more)
-                    time.sleep(3)
+                    loaded = self._wait_for_more_comments(driver, count) or loaded
                 except:
                     pass
+                
+                # Fin du fil : aucun nouveau commentaire deux fois de suite
+                misses = 0 if loaded else misses + 1
+                if misses >= 2:
+                    break
             
             # Extraction des commentaires
             comments = []
             
-            # Sélecteurs possibles pour les commentaires
+            # Sélecteurs possibles pour les commentaires : le premier suffit en
+            # général, le second (union CSS, chaque élément une seule fois) sert
+            # de repli s'il ne trouve pas assez de commentaires
             comment_selectors = [
                 "[class*='comment']",
-                "[data-testid*='comment']",
-                ".comment",
-                ".discussion-item",
-                "[role='article']"
+                "[class*='comment'], [data-testid*='comment'], .discussion-item, [role='article']"
             ]
             
+            # Texte, auteur et date de tous les éléments en un seul appel WebDriver
+            extract_js = f"return Array.from(document.querySelectorAll(arguments[0])).map({self._COMMENT_FIELDS_JS});"
             for selector in comment_selectors:
                 try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        text = elem.text.strip()
-                        if len(text) > 20:
-                            comments.append({
-                                'text': text,
-                                'author': self._extract_author_selenium(elem),
-                                'date': self._extract_date_selenium(elem)
-                            })
+                    elements = driver.execute_script(extract_js, selector)
                 except:
                     continue
+                comments = [elem for elem in elements if len(elem['text']) > 20]
+                if len(comments) >= 20:
+                    break
             
             return {
                 'url': url,
                 'title': title,
                 'comments': comments,
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': _now_iso()
             }
             
         except Exception as e:
-            print(f"Erreur lors du scraping avec Selenium : {e}")
+            logger.warning("Erreur lors du scraping avec Selenium : %s", e)
             return None
         finally:
             if driver:
-                driver.quit()
-    
-    def _extract_author(self, element):
-        """Extrait le nom de l'auteur d'un commentaire (BeautifulSoup)"""
-        author_selectors = ['span.author', '.username', '.user-name', '[class*="author"]']
-        for selector in author_selectors:
-            author_elem = element.select_one(selector)
-            if author_elem:
-                return author_elem.get_text(strip=True)
-        return "Anonyme"
-    
-    def _extract_date(self, element):
-        """Extrait la date d'un commentaire (BeautifulSoup)"""
-        date_selectors = ['time', '.date', '.timestamp', '[datetime]']
-        for selector in date_selectors:
-            date_elem = element.select_one(selector)
-            if date_elem:
-                return date_elem.get('datetime') or date_elem.get_text(strip=True)
-        return ""
-    
-    def _extract_author_selenium(self, element):
-        """Extrait le nom de l'auteur d'un commentaire (Selenium)"""
+                self._reset_driver()
+    
+    async def scrape_with_playwright(self, url, max_scroll=5):
+        """
+        Méthode de scraping avec Playwright (asynchrone, attentes pilotées par le DOM)
+        
+        Args:
+            url (str): URL de l'article
+            max_scroll (int): Nombre maximum de scrolls pour charger plus de commentaires
+            
+        Returns:
+            dict: Données extraites
+        """
+        comment_selector = "[class*='comment']"
         try:
-            author = element.find_element(By.CSS_SELECTOR, "[class*='author'], .username, .user-name")
-            return author.text.strip()
-        except:
-            return "Anonyme"
+            logger.info("Ouverture de la page avec Playwright : %s", url)
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=self.headless)
+                try:
+                    context = await browser.new_context(
+                        user_agent=self.headers['User-Agent'],
+                        # Seule la langue est imposée : Accept & co. s'appliqueraient
+                        # aussi aux appels XHR/fetch qui chargent les commentaires
+                        extra_http_headers={'Accept-Language': self.headers['Accept-Language']},
+                    )
+                    page = await context.new_page()
+                    await page.goto(url, wait_until='domcontentloaded')
+                    
+                    # Titre de l'article
+                    h1 = page.locator('h1').first
+                    title = await h1.inner_text() if await h1.count() else await page.title()
+                    
+                    # Faire défiler pour charger plus de commentaires : on attend
+                    # l'apparition de nouveaux commentaires plutôt qu'un délai fixe
+                    comments_js = f"document.querySelectorAll(\"{comment_selector}\").length"
+                    for i in range(max_scroll):
+                        count = await page.evaluate(comments_js)
+                        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                        
+                        # Chercher et cliquer sur "Voir plus de commentaires" si disponible
+                        load_more = page.locator("xpath=//*[contains(text(), 'commentaires') or contains(text(), 'Voir plus')]").first
+                        if await load_more.count():
+                            await load_more.evaluate("e => e.click()")
+                        
+                        try:
+                            await page.wait_for_function(f"n => {comments_js} > n", arg=count, timeout=3000)
+                        except PlaywrightTimeoutError:
+                            break
+                    
+                    # Extraction des commentaires en un seul aller-retour
+                    elements = await page.locator(comment_selector).evaluate_all(
+                        f"els => els.map({self._COMMENT_FIELDS_JS})"
+                    )
+                finally:
+                    await browser.close()
+            
+            comments = [elem for elem in elements if len(elem['text']) > 20]
+            
+            return {
+                'url': url,
+                'title': title,
+                'comments': comments,
+                'scraped_at': _now_iso()
+            }
+        
+        except Exception as e:
+            logger.warning("Erreur lors du scraping avec Playwright : %s", e)
+            return None
+    
+    def _count_comments_selenium(self, driver):
+        """Compte les commentaires présents dans la page (Selenium)"""
+        return driver.execute_script(
+            "return document.querySelectorAll(\"[class*='comment']\").length;"
+        )
     
-    def _extract_date_selenium(self, element):
-        """Extrait la date d'un commentaire (Selenium)"""
+    def _wait_for_more_comments(self, driver, previous, timeout=3):
+        """Attend que de nouveaux commentaires apparaissent, renvoie False sinon (Selenium)"""
         try:
-            date_elem = element.find_element(By.CSS_SELECTOR, "time, .date, .timestamp, [datetime]")
-            return date_elem.get_attribute('datetime') or date_elem.text.strip()
-        except:
-            return ""
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                lambda d: self._count_comments_selenium(d) > previous
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def _ensure_driver(self):
+        """Renvoie le navigateur partagé, en le recréant si la session est perdue"""
+        if self._driver is not None:
+            try:
+                if self._driver.session_id:
+                    self._driver.current_url
+                    return self._driver
+            except (InvalidSessionIdException, WebDriverException, MaxRetryError, OSError):
+                # Session perdue ou processus chromedriver arrêté : on recrée
+                pass
+            self.close_driver()
+        
+        self._driver = webdriver.Chrome(options=self.chrome_options)
+        try:
+            self._driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        except Exception:
+            self.close_driver()
+            raise
+        return self._driver
+    
+    def _reset_driver(self):
+        """Remet le navigateur dans un état neutre entre deux URLs"""
+        try:
+            self._driver.delete_all_cookies()
+            self._driver.get('about:blank')
+        except Exception:
+            self.close_driver()
+    
+    def close_driver(self):
+        """Ferme le navigateur partagé"""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+    
+    def close(self):
+        """Libère toutes les ressources (navigateur, session HTTP, processus) et sauvegarde le cache HTTP"""
+        self.close_driver()
+        self.session.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+        self.save_validators()
     
     def save_to_json(self, data, filename):
         """Sauvegarde les données en JSON"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"Données sauvegardées dans {filename}")
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        logger.info("Données sauvegardées dans %s", filename)
     
     def save_to_csv(self, data, filename):
         """Sauvegarde les commentaires en CSV"""
         if not data or not data.get('comments'):
-            print("Aucun commentaire à sauvegarder")
+            logger.warning("Aucun commentaire à sauvegarder")
             return
         
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(['URL', 'Titre', 'Auteur', 'Date', 'Commentaire'])
-            
-            for comment in data['comments']:
-                writer.writerow([
-                    data['url'],
-                    data['title'],
-                    comment['author'],
-                    comment['date'],
-                    comment['text']
-                ])
-        print(f"Commentaires sauvegardés dans {filename}")
+            writer.writerows(
+                (data['url'], data['title'], comment['author'], comment['date'], comment['text'])
+                for comment in data['comments']
+            )
+        logger.info("Commentaires sauvegardés dans %s", filename)
 
 def main():
     """Fonction principale"""
-    url = "https://www.lemonde.fr/idees/article/2025/09/12/comment-la-politique-de-l-offre-detourne-l-argent-public-au-profit-des-plus-riches_6640595_3232.html"
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     
-    scraper = LeMondeScraper()
-    
-    print("=== Scraping des commentaires Le Monde ===\n")
+    url = "https://www.lemonde.fr/idees/article/2025/09/12/comment-la-politique-de-l-offre-detourne-l-argent-public-au-profit-des-plus-riches_6640595_3232.html"
     
-    # Méthode 1: Avec requests (plus rapide)
-    print("1. Tentative avec requests...")
-    data = scraper.scrape_with_requests(url)
+    scraper = LeMondeScraper(validators_file='lemonde_validators.json')
     
-    if data and data['comments']:
-        print(f"✓ {len(data['comments'])} commentaires trouvés avec requests")
-    else:
-        print("✗ Aucun commentaire trouvé avec requests")
+    try:
+        print("=== Scraping des commentaires Le Monde ===\n")
         
-        # Méthode 2: Avec Selenium (plus robuste)
-        print("\n2. Tentative avec Selenium...")
-        try:
-            data = scraper.scrape_with_selenium(url)
-            if data and data['comments']:
-                print(f"✓ {len(data['comments'])} commentaires trouvés avec Selenium")
-            else:
-                print("✗ Aucun commentaire trouvé avec Selenium")
-        except Exception as e:
-            print(f"✗ Erreur avec Selenium: {e}")
-            print("Note: Assurez-vous d'avoir ChromeDriver installé")
-    
-    # Sauvegarde des résultats
-    if data:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        scraper.save_to_json(data, f"lemonde_comments_{timestamp}.json")
-        scraper.save_to_csv(data, f"lemonde_comments_{timestamp}.csv")
+        # Méthode 1: Avec requests (plus rapide)
+        print("1. Tentative avec requests...")
+        data = scraper.scrape_with_requests(url)
         
-        print(f"\n=== Résumé ===")
-        print(f"Titre: {data['title']}")
-        print(f"URL: {data['url']}")
-        print(f"Nombre de commentaires: {len(data['comments'])}")
+        if data and data['comments']:
+            print(f"✓ {len(data['comments'])} commentaires trouvés avec requests")
+        else:
+            print("✗ Aucun commentaire trouvé avec requests")
+            
+            # Méthode 2: Avec Selenium (plus robuste)
+            print("\n2. Tentative avec Selenium...")
+            try:
+                data = scraper.scrape_with_selenium(url)
+                if data and data['comments']:
+                    print(f"✓ {len(data['comments'])} commentaires trouvés avec Selenium")
+                else:
+                    print("✗ Aucun commentaire trouvé avec Selenium")
+            except Exception as e:
+                print(f"✗ Erreur avec Selenium: {e}")
+                print("Note: Assurez-vous d'avoir ChromeDriver installé")
         
-        if data['comments']:
-            print(f"\nPremier commentaire:")
-            print(f"Auteur: {data['comments'][0]['author']}")
-            print(f"Date: {data['comments'][0]['date']}")
-            print(f"Texte: {data['comments'][0]['text'][:200]}...")
-    else:
-        print("\n⚠️ Aucune donnée récupérée. Le site pourrait bloquer le scraping.")
-        print("Conseils:")
-        print("- Utilisez un VPN")
-        print("- Ajoutez des délais plus longs")
-        print("- Vérifiez que l'article a des commentaires activés")
+        # Sauvegarde des résultats
+        if data:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            scraper.save_to_json(data, f"lemonde_comments_{timestamp}.json")
+            scraper.save_to_csv(data, f"lemonde_comments_{timestamp}.csv")
+            
+            print(f"\n=== Résumé ===")
+            print(f"Titre: {data['title']}")
+            print(f"URL: {data['url']}")
+            print(f"Nombre de commentaires: {len(data['comments'])}")
+            
+            if data['comments']:
+                print(f"\nPremier commentaire:")
+                print(f"Auteur: {data['comments'][0]['author']}")
+                print(f"Date: {data['comments'][0]['date']}")
+                print(f"Texte: {data['comments'][0]['text'][:200]}...")
+        else:
+            print("\n⚠️ Aucune donnée récupérée. Le site pourrait bloquer le scraping.")
+            print("Conseils:")
+            print("- Utilisez un VPN")
+            print("- Ajoutez des délais plus longs")
+            print("- Vérifiez que l'article a des commentaires activés")
+    finally:
+        scraper.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file